@@ -0,0 +1,247 @@
+"""
+Path-dependent Monte Carlo engine
+"""
+
+import datetime
+import math
+import numpy as np
+
+
+class PathMonteCarlo:
+    """
+    Time-stepped GBM Monte Carlo engine for path-dependent options (Asian and barrier). Prices and greeks.
+    """
+    _AVERAGES = ["arithmetic", "geometric"]
+    _BARRIER_TYPES = ["down-and-out", "down-and-in", "up-and-out", "up-and-in"]
+    _GREEK_METHODS = ["pathwise", "likelihood_ratio"]
+
+    def __init__(self, option, n_paths=100_000, n_steps=252, seed=42, block_size=32):
+        """
+
+        Args:
+            option (Option): the option providing the market inputs (price, strike, volatility, rates, maturity)
+            n_paths (int): number of simulated paths
+            n_steps (int): number of monitoring dates (time steps) up to maturity
+            seed (int): optional, seed for reproducibility
+            block_size (int): number of time steps simulated at once, bounds memory to n_paths * block_size
+        """
+        for name, value in (("n_paths", n_paths), ("n_steps", n_steps), ("block_size", block_size)):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"{name} must be a positive integer.")
+        self.option = option
+        self.n_paths = n_paths
+        self.n_steps = n_steps
+        self.seed = seed
+        self.block_size = block_size
+
+    def __repr__(self):
+        return f"PathMonteCarlo(option={self.option!r}, n_paths={self.n_paths}, n_steps={self.n_steps})"
+
+    def asian_price(self, average="arithmetic"):
+        """
+        Calculate the price of an Asian option on the average of the monitored prices
+
+        Args:
+            average (str): "arithmetic" or "geometric"
+
+        Returns:
+            tuple: call and put option prices
+        """
+        self._check_choice("average", average, self._AVERAGES)
+        sim = self._simulate()
+        avg = sim["arithmetic"] if average == "arithmetic" else sim["geometric"]
+        disc = math.exp(-self.option.risk_free_rate * sim["t"])
+        return (disc * np.mean(np.maximum(avg - self.option.strike, 0)),
+                disc * np.mean(np.maximum(self.option.strike - avg, 0)))
+
+    def barrier_price(self, barrier, barrier_type="down-and-out", bridge_correction=True):
+        """
+        Calculate the price of a knock-in/knock-out barrier option
+
+        Args:
+            barrier (float or int): the barrier level
+            barrier_type (str): "down-and-out", "down-and-in", "up-and-out" or "up-and-in"
+            bridge_correction (bool): optional, apply the Brownian bridge correction for crossings between dates
+
+        Returns:
+            tuple: call and put option prices
+        """
+        self._check_barrier(barrier, barrier_type)
+        sim = self._simulate(barrier, barrier_type, bridge_correction)
+        weight = sim["survival"] if barrier_type.endswith("out") else 1 - sim["survival"]
+        disc = math.exp(-self.option.risk_free_rate * sim["t"])
+        return (disc * np.mean(np.maximum(sim["terminal"] - self.option.strike, 0) * weight),
+                disc * np.mean(np.maximum(self.option.strike - sim["terminal"], 0) * weight))
+
+    def asian_greeks(self, average="arithmetic", method="pathwise"):
+        """
+        Calculate Monte Carlo delta and vega of an Asian option
+
+        Args:
+            average (str): "arithmetic" or "geometric"
+            method (str): "pathwise" or "likelihood_ratio"
+
+        Returns:
+            tuple: delta (call, put) and vega (call, put)
+        """
+        self._check_choice("average", average, self._AVERAGES)
+        self._check_choice("method", method, self._GREEK_METHODS)
+        sim = self._simulate(greeks=True)
+        avg = sim["arithmetic"] if average == "arithmetic" else sim["geometric"]
+        disc = math.exp(-self.option.risk_free_rate * sim["t"])
+        call_payoff = np.maximum(avg - self.option.strike, 0)
+        put_payoff = np.maximum(self.option.strike - avg, 0)
+        if method == "pathwise":
+            # The average is homogeneous in the spot price, so dA/dS0 = A / S0
+            d_avg_d_spot = avg / self.option.price
+            d_avg_d_vol = sim["arithmetic_vega"] if average == "arithmetic" else sim["geometric_vega"]
+            itm_call = avg > self.option.strike
+            delta = (disc * np.mean(np.where(itm_call, d_avg_d_spot, 0)),
+                     -disc * np.mean(np.where(~itm_call, d_avg_d_spot, 0)))
+            vega = (disc * np.mean(np.where(itm_call, d_avg_d_vol, 0)),
+                    -disc * np.mean(np.where(~itm_call, d_avg_d_vol, 0)))
+        else:
+            delta = (disc * np.mean(call_payoff * sim["delta_score"]),
+                     disc * np.mean(put_payoff * sim["delta_score"]))
+            vega = (disc * np.mean(call_payoff * sim["vega_score"]),
+                    disc * np.mean(put_payoff * sim["vega_score"]))
+        return delta, vega
+
+    def barrier_greeks(self, barrier, barrier_type="down-and-out", bridge_correction=True,
+                       method="likelihood_ratio"):
+        """
+        Calculate Monte Carlo delta and vega of a barrier option. The barrier payoff is discontinuous, hence only
+        the likelihood ratio method is supported.
+
+        Args:
+            barrier (float or int): the barrier level
+            barrier_type (str): "down-and-out", "down-and-in", "up-and-out" or "up-and-in"
+            bridge_correction (bool): optional, apply the Brownian bridge correction for crossings between dates
+            method (str): "likelihood_ratio"
+
+        Returns:
+            tuple: delta (call, put) and vega (call, put)
+        """
+        self._check_barrier(barrier, barrier_type)
+        self._check_choice("method", method, self._GREEK_METHODS)
+        if method == "pathwise":
+            raise ValueError("pathwise greeks are not available for barrier options, use likelihood_ratio.")
+        sim = self._simulate(barrier, barrier_type, bridge_correction, greeks=True)
+        sign = 1 if barrier_type.endswith("out") else -1
+        weight = sim["survival"] if sign == 1 else 1 - sim["survival"]
+        disc = math.exp(-self.option.risk_free_rate * sim["t"])
+        greeks = []
+        for score, explicit in ((sim["delta_score"], sim["survival_d_spot"]),
+                                (sim["vega_score"], sim["survival_d_vol"])):
+            # Score term for the path density plus the explicit dependence of the bridge survival weight
+            d_weight = weight * score + sign * explicit
+            greeks.append((disc * np.mean(np.maximum(sim["terminal"] - self.option.strike, 0) * d_weight),
+                           disc * np.mean(np.maximum(self.option.strike - sim["terminal"], 0) * d_weight)))
+        return tuple(greeks)
+
+    def _simulate(self, barrier=None, barrier_type=None, bridge_correction=True, greeks=False):
+        """
+        Auxiliary function. Do not access directly.
+        Simulates the GBM paths in blocks of time steps, keeping only per-path running statistics.
+
+        Returns:
+            dict: time to maturity and per-path statistics
+        """
+        opt = self.option
+        t = (opt.maturity - datetime.date.today()).days / 360
+        dt = t / self.n_steps
+        sigma, sqrt_dt = opt.volatility, math.sqrt(dt)
+        drift = (opt.risk_free_rate - opt.dividend_yield - 0.5 * sigma ** 2) * dt
+        vega_drift = opt.risk_free_rate - opt.dividend_yield + 0.5 * sigma ** 2
+        log_spot = math.log(opt.price)
+        rng = np.random.default_rng(self.seed)
+
+        n = self.n_paths
+        log_s = np.full(n, log_spot)
+        sum_s, sum_log_s = np.zeros(n), np.zeros(n)
+        sum_s_d_vol, sum_d_vol, vega_score, delta_score = np.zeros(n), np.zeros(n), np.zeros(n), None
+        survival, survival_d_spot, survival_d_vol = np.ones(n), np.zeros(n), np.zeros(n)
+        if barrier is not None:
+            log_barrier = math.log(barrier)
+            direction = 1 if barrier_type.startswith("down") else -1
+
+        for start in range(0, self.n_steps, self.block_size):
+            m = min(self.block_size, self.n_steps - start)
+            z = rng.standard_normal((n, m))
+            log_path = log_s[:, None] + np.cumsum(drift + sigma * sqrt_dt * z, axis=1)
+            s = np.exp(log_path)
+            sum_s += s.sum(axis=1)
+            sum_log_s += log_path.sum(axis=1)
+
+            if greeks:
+                # dlog(S_i)/dsigma along the path, for the pathwise method
+                d_vol = (log_path - log_spot - vega_drift * dt * np.arange(start + 1, start + m + 1)) / sigma
+                sum_s_d_vol += (s * d_vol).sum(axis=1)
+                sum_d_vol += d_vol.sum(axis=1)
+                # Score functions of the path density, for the likelihood ratio method
+                vega_score += ((z ** 2 - 1) / sigma - z * sqrt_dt).sum(axis=1)
+                if start == 0:
+                    delta_score = z[:, 0] / (opt.price * sigma * sqrt_dt)
+
+            if barrier is not None:
+                dist_next = direction * (log_path - log_barrier)
+                alive = dist_next > 0
+                if not bridge_correction:
+                    survival *= alive.all(axis=1)
+                else:
+                    # Probability of crossing the barrier between two dates given both endpoints
+                    dist_prev = np.concatenate((direction * (log_s[:, None] - log_barrier), dist_next[:, :-1]), axis=1)
+                    exponent = np.where(alive, 2 * np.maximum(dist_prev, 0) * dist_next / (sigma ** 2 * dt), 0)
+                    cross = np.where(alive, np.exp(-exponent), 1)
+                    factor = 1 - cross
+                    block_survival = np.prod(factor, axis=1)
+                    if greeks:
+                        # Explicit derivatives of the survival weight (product rule over the crossing probabilities)
+                        ones = np.ones((n, 1))
+                        before = np.cumprod(np.concatenate((ones, factor[:, :-1]), axis=1), axis=1)
+                        after = np.cumprod(np.concatenate((ones, factor[:, :0:-1]), axis=1), axis=1)[:, ::-1]
+                        d_cross_d_vol = cross * 2 * exponent / sigma
+                        survival_d_vol = survival_d_vol * block_survival - survival * np.sum(
+                            before * d_cross_d_vol * after, axis=1)
+                        survival_d_spot = survival_d_spot * block_survival
+                        if start == 0:
+                            d_cross_d_spot = -cross[:, 0] * 2 * direction * dist_next[:, 0] / (
+                                    sigma ** 2 * dt * opt.price)
+                            survival_d_spot -= np.where(alive[:, 0], d_cross_d_spot, 0) * after[:, 0]
+                    survival *= block_survival
+            log_s = log_path[:, -1]
+
+        geometric = np.exp(sum_log_s / self.n_steps)
+        return {
+            "t": t,
+            "terminal": np.exp(log_s),
+            "arithmetic": sum_s / self.n_steps,
+            "geometric": geometric,
+            "arithmetic_vega": sum_s_d_vol / self.n_steps,
+            "geometric_vega": geometric * sum_d_vol / self.n_steps,
+            "delta_score": delta_score,
+            "vega_score": vega_score,
+            "survival": survival,
+            "survival_d_spot": survival_d_spot,
+            "survival_d_vol": survival_d_vol,
+        }
+
+    def _check_barrier(self, barrier, barrier_type):
+        """
+        Auxiliary function. Do not access directly.
+        """
+        self._check_choice("barrier_type", barrier_type, self._BARRIER_TYPES)
+        if not isinstance(barrier, (int, float)) or barrier <= 0:
+            raise ValueError("barrier must be a positive number.")
+        if barrier_type.startswith("down") and barrier >= self.option.price:
+            raise ValueError("barrier must be below the underlying price for down barriers.")
+        if barrier_type.startswith("up") and barrier <= self.option.price:
+            raise ValueError("barrier must be above the underlying price for up barriers.")
+
+    @staticmethod
+    def _check_choice(name, value, choices):
+        """
+        Auxiliary function. Do not access directly.
+        """
+        if value not in choices:
+            raise ValueError(f"{name} must be one of {', '.join(choices)}.")
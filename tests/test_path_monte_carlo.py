@@ -0,0 +1,92 @@
+"""
+Testing path-dependent Monte Carlo engine
+Command line: py -m pytest tests/test_path_monte_carlo.py
+"""
+import math
+import datetime
+import pytest
+from scipy import stats as sts
+from option_class import Option
+from path_monte_carlo import PathMonteCarlo
+
+
+@pytest.fixture
+def input_data():
+    return {
+        "price": 100,
+        "strike": 100,
+        "maturity": datetime.date.today() + datetime.timedelta(days=360),
+        "risk_free_rate": 0.03,
+        "volatility": 0.2,
+        "dividend_yield": 0.01
+    }
+
+
+@pytest.fixture
+def engine(input_data):
+    return PathMonteCarlo(Option(**input_data), n_paths=50_000, n_steps=50)
+
+
+def test_geometric_asian_closed_form(engine, input_data):
+    n, t = engine.n_steps, 1
+    r, q, sigma = input_data["risk_free_rate"], input_data["dividend_yield"], input_data["volatility"]
+    mean = math.log(input_data["price"]) + (r - q - 0.5 * sigma ** 2) * t * (n + 1) / (2 * n)
+    var = sigma ** 2 * t * (n + 1) * (2 * n + 1) / (6 * n ** 2)
+    d1 = (mean - math.log(input_data["strike"]) + var) / math.sqrt(var)
+    d2 = d1 - math.sqrt(var)
+    ref_c = math.exp(-r * t) * (math.exp(mean + var / 2) * sts.norm.cdf(d1) - input_data["strike"] * sts.norm.cdf(d2))
+    ref_p = math.exp(-r * t) * (input_data["strike"] * sts.norm.cdf(-d2) - math.exp(mean + var / 2) * sts.norm.cdf(-d1))
+    c, p = engine.asian_price("geometric")
+    assert math.isclose(c, ref_c, abs_tol=0.1)
+    assert math.isclose(p, ref_p, abs_tol=0.1)
+
+
+def test_arithmetic_above_geometric(engine):
+    assert engine.asian_price("arithmetic")[0] >= engine.asian_price("geometric")[0]
+    assert engine.asian_price("arithmetic")[1] <= engine.asian_price("geometric")[1]
+
+
+@pytest.mark.parametrize("average", ["arithmetic", "geometric"])
+def test_asian_greeks_methods_agree(engine, average):
+    pathwise = engine.asian_greeks(average, "pathwise")
+    likelihood_ratio = engine.asian_greeks(average, "likelihood_ratio")
+    for greek_pw, greek_lr, tol in zip(pathwise, likelihood_ratio, (0.05, 3)):
+        assert math.isclose(greek_pw[0], greek_lr[0], abs_tol=tol)
+        assert math.isclose(greek_pw[1], greek_lr[1], abs_tol=tol)
+
+
+@pytest.mark.parametrize("barrier, barrier_type", [(90, "down"), (115, "up")])
+def test_barrier_in_out_parity(engine, barrier, barrier_type):
+    out_c, out_p = engine.barrier_price(barrier, f"{barrier_type}-and-out")
+    in_c, in_p = engine.barrier_price(barrier, f"{barrier_type}-and-in")
+    c, p = engine.option.black_scholes_price()
+    assert math.isclose(out_c + in_c, c, abs_tol=0.15)
+    assert math.isclose(out_p + in_p, p, abs_tol=0.15)
+
+
+@pytest.mark.parametrize("barrier, barrier_type", [(90, "down-and-out"), (115, "up-and-out")])
+def test_bridge_correction_knocks_out_more(engine, barrier, barrier_type):
+    corrected = engine.barrier_price(barrier, barrier_type, bridge_correction=True)
+    discrete = engine.barrier_price(barrier, barrier_type, bridge_correction=False)
+    assert corrected[0] <= discrete[0]
+    assert corrected[1] <= discrete[1]
+
+
+def test_barrier_greeks(engine):
+    (delta_c, delta_p), _ = engine.barrier_greeks(90, "down-and-out")
+    assert 0 < delta_c < 1
+    with pytest.raises(ValueError):
+        engine.barrier_greeks(90, "down-and-out", method="pathwise")
+
+
+@pytest.mark.parametrize("barrier, barrier_type", [(110, "down-and-out"), (90, "up-and-in"), (90, "sideways"),
+                                                   (-1, "down-and-in")])
+def test_invalid_barrier(engine, barrier, barrier_type):
+    with pytest.raises(ValueError):
+        engine.barrier_price(barrier, barrier_type)
+
+
+@pytest.mark.parametrize("param", ["n_paths", "n_steps", "block_size"])
+def test_invalid_engine_param(input_data, param):
+    with pytest.raises(ValueError):
+        PathMonteCarlo(Option(**input_data), **{param: 0})